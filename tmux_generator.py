@@ -4,216 +4,420 @@ TMUX Configuration Generator
 Generates .tmux.conf file based on questionnaire responses
 """
 
+import io
 import json
 import os
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        from json import loads as _json_loads
+
+
+# Rule drawn above and below each section title
+_BANNER = "# " + "═" * 67 + "\n"
+
+# Values used for any option missing from the questionnaire responses
+_DEFAULTS = MappingProxyType({
+    "prefix_key": "C-b",
+    "custom_prefix": "C-b",
+    "enable_mouse": True,
+    "enable_256_colors": True,
+    "enable_true_colors": True,
+    "status_position": "bottom",
+    "color_scheme": "default",
+    "show_session_name": True,
+    "show_hostname": False,
+    "show_date": True,
+    "show_time": True,
+    "history_limit": 5000,
+    "base_index": 1,
+    "automatic_rename": False,
+    "renumber_windows": True,
+    "terminal_mode": "emacs",
+    "vim_navigation": False,
+    "vim_copy_mode": False,
+    "enable_pane_synchronization": False,
+    "use_tpm": False,
+    "plugins": (),
+    "enable_copy_paste": False,
+    "enable_logging": False,
+})
+
+# Color palettes for each supported color scheme
+_COLOR_SCHEMES = MappingProxyType({
+    "dracula": MappingProxyType({
+        "bg": "#282a36",
+        "fg": "#f8f8f2",
+        "current_line": "#44475a",
+        "comment": "#6272a4",
+        "cyan": "#8be9fd",
+        "green": "#50fa7b",
+        "orange": "#ffb86c",
+        "pink": "#ff79c6",
+        "purple": "#bd93f9",
+        "red": "#ff5555",
+        "yellow": "#f1fa8c"
+    }),
+    "nord": MappingProxyType({
+        "polar_night_0": "#2e3440",
+        "polar_night_1": "#3b4252",
+        "polar_night_2": "#434c5e",
+        "polar_night_3": "#4c566a",
+        "snow_storm_0": "#d8dee9",
+        "snow_storm_1": "#e5e9f0",
+        "snow_storm_2": "#eceff4",
+        "frost_0": "#8fbcbb",
+        "frost_1": "#88c0d0",
+        "frost_2": "#81a1c1",
+        "frost_3": "#5e81ac",
+        "aurora_0": "#bf616a",
+        "aurora_1": "#d08770",
+        "aurora_2": "#ebcb8b",
+        "aurora_3": "#a3be8c",
+        "aurora_4": "#b48ead"
+    }),
+    "gruvbox": MappingProxyType({
+        "bg": "#282828",
+        "fg": "#ebdbb2",
+        "red": "#cc241d",
+        "green": "#98971a",
+        "yellow": "#d79921",
+        "blue": "#458588",
+        "purple": "#b16286",
+        "aqua": "#689d6a",
+        "gray": "#a89984",
+        "orange": "#d65d0e"
+    }),
+    "solarized": MappingProxyType({
+        "base03": "#002b36",
+        "base02": "#073642",
+        "base01": "#586e75",
+        "base00": "#657b83",
+        "base0": "#839496",
+        "base1": "#93a1a1",
+        "base2": "#eee8d5",
+        "base3": "#fdf6e3",
+        "yellow": "#b58900",
+        "orange": "#cb4b16",
+        "red": "#dc322f",
+        "magenta": "#d33682",
+        "violet": "#6c71c4",
+        "blue": "#268bd2",
+        "cyan": "#2aa198",
+        "green": "#859900"
+    }),
+    "catppuccin": MappingProxyType({
+        "rosewater": "#f5e0dc",
+        "flamingo": "#f2cdcd",
+        "pink": "#f5c2e7",
+        "mauve": "#cba6f7",
+        "red": "#f38ba8",
+        "maroon": "#eba0ac",
+        "peach": "#fab387",
+        "yellow": "#f9e2af",
+        "green": "#a6e3a1",
+        "teal": "#94e2d5",
+        "sky": "#89dceb",
+        "sapphire": "#74c7ec",
+        "blue": "#89b4fa",
+        "lavender": "#b4befe",
+        "text": "#cdd6f4",
+        "subtext1": "#bac2de",
+        "subtext0": "#a6adc8",
+        "overlay2": "#9399b2",
+        "overlay1": "#7f849c",
+        "overlay0": "#6c7086",
+        "surface2": "#585b70",
+        "surface1": "#45475a",
+        "surface0": "#313244",
+        "base": "#1e1e2e",
+        "mantle": "#181825",
+        "crust": "#11111b"
+    })
+})
+
+# tmux settings for each color scheme, filled from the scheme's palette
+_SCHEME_TEMPLATES = MappingProxyType({
+    "dracula": (
+        "set -g status-bg '{current_line}'\n"
+        "set -g status-fg '{fg}'\n"
+        "set -g window-status-current-style 'bg={purple},fg={bg}'\n"
+        "set -g pane-border-style 'fg={comment}'\n"
+        "set -g pane-active-border-style 'fg={purple},bg={purple}'\n"
+        "set -g pane-border-format-style 'fg={fg},bg={comment}'\n"
+        "\n"
+    ),
+    "nord": (
+        "set -g status-bg '{polar_night_0}'\n"
+        "set -g status-fg '{snow_storm_0}'\n"
+        "set -g window-status-current-style 'bg={frost_3},fg={snow_storm_2}'\n"
+        "set -g pane-border-style 'fg={polar_night_2}'\n"
+        "set -g pane-active-border-style 'fg={frost_1},bg={frost_1}'\n"
+        "set -g pane-border-format-style 'fg={snow_storm_2},bg={polar_night_1}'\n"
+        "\n"
+    ),
+    "gruvbox": (
+        "set -g status-bg '{bg}'\n"
+        "set -g status-fg '{fg}'\n"
+        "set -g window-status-current-style 'bg={orange},fg={bg}'\n"
+        "set -g pane-border-style 'fg={gray}'\n"
+        "set -g pane-active-border-style 'fg={orange},bg={orange}'\n"
+        "set -g pane-border-format-style 'fg={fg},bg={gray}'\n"
+        "\n"
+    ),
+    "solarized": (
+        "set -g status-bg '{base02}'\n"
+        "set -g status-fg '{base0}'\n"
+        "set -g window-status-current-style 'bg={blue},fg={base3}'\n"
+        "set -g pane-border-style 'fg={base01}'\n"
+        "set -g pane-active-border-style 'fg={blue},bg={blue}'\n"
+        "set -g pane-border-format-style 'fg={base3},bg={base01}'\n"
+        "\n"
+    ),
+    "catppuccin": (
+        "set -g status-bg '{base}'\n"
+        "set -g status-fg '{text}'\n"
+        "set -g window-status-current-style 'bg={mauve},fg={base}'\n"
+        "set -g pane-border-style 'fg={surface0}'\n"
+        "set -g pane-active-border-style 'fg={mauve},bg={mauve}'\n"
+        "set -g pane-border-format-style 'fg={text},bg={surface0}'\n"
+        "\n"
+    ),
+})
+
+
+def _status_bar_block(mask: int) -> str:
+    """Build the status bar block for a session/hostname/date/time bit mask"""
+    status_left = ["#S"] if mask & 0b1000 else []
+    status_right = [
+        item for bit, item in ((0b0100, "#H"), (0b0010, "%Y-%m-%d"), (0b0001, "%H:%M"))
+        if mask & bit
+    ]
+    
+    if not (status_left or status_right):
+        return ""
+    
+    return (
+        "# Status bar configuration\n"
+        f"set -g status-left '[{' | '.join(status_left)}] '\n"
+        f"set -g status-right ' {' | '.join(status_right)}'\n"
+        "set -g status-left-length 50\n"
+        "set -g status-right-length 50\n"
+        "\n"
+    )
+
+
+# Status bar block for every combination of the four status bar options
+_STATUS_BAR_BLOCKS = tuple(_status_bar_block(mask) for mask in range(16))
+
+# Repository for each supported plugin, in the order they are listed
+_PLUGIN_REPOS = (
+    ("tmux-sensible", "tmux-plugins/tmux-sensible"),
+    ("tmux-resurrect", "tmux-plugins/tmux-resurrect"),
+    ("tmux-continuum", "tmux-plugins/tmux-continuum"),
+    ("tmux-copycat", "tmux-plugins/tmux-copycat"),
+    ("tmux-yank", "tmux-plugins/tmux-yank"),
+    ("tmux-sidebar", "tmux-plugins/tmux-sidebar"),
+    ("tmux-battery", "tmux-plugins/tmux-battery"),
+    ("tmux-cpu", "tmux-plugins/tmux-cpu"),
+    ("tmux-net-speed", "tmux-plugins/tmux-net-speed"),
+)
+
+# Fixed blocks that do not depend on the configuration
+_RELOAD_BINDING = (
+    "# Reload configuration with Prefix + r\n"
+    "bind r source-file ~/.tmux.conf \\; display-message \"Config reloaded!\"\n"
+    "\n"
+)
+
+_KEY_BINDINGS = (
+    f"{_BANNER}"
+    "# KEY BINDINGS\n"
+    f"{_BANNER}"
+    "\n"
+    "# Split panes using | and -\n"
+    "bind | split-window -h\n"
+    "bind - split-window -v\n"
+    "unbind '\"'\n"
+    "unbind %\n"
+    "\n"
+    "# Switch panes using Alt+arrow without prefix\n"
+    "bind -n M-Left select-pane -L\n"
+    "bind -n M-Right select-pane -R\n"
+    "bind -n M-Up select-pane -U\n"
+    "bind -n M-Down select-pane -D\n"
+    "\n"
+)
+
+_FOOTER = (
+    f"{_BANNER}"
+    "# END OF CONFIGURATION\n"
+    f"{_BANNER}"
+    "\n"
+    "# To apply changes:\n"
+    "# 1. Save this file as ~/.tmux.conf\n"
+    "# 2. Reload with: tmux source-file ~/.tmux.conf\n"
+    "# 3. Or use the reload binding: Prefix + r\n"
+)
 
 
 class TmuxConfigGenerator:
     """Generate tmux configuration file from questionnaire responses"""
     
     def __init__(self, config_data: Dict):
-        self.config = config_data
-        self.lines = []
-        
-        # Color schemes definitions
-        self.color_schemes = {
-            "dracula": {
-                "bg": "#282a36",
-                "fg": "#f8f8f2",
-                "current_line": "#44475a",
-                "comment": "#6272a4",
-                "cyan": "#8be9fd",
-                "green": "#50fa7b",
-                "orange": "#ffb86c",
-                "pink": "#ff79c6",
-                "purple": "#bd93f9",
-                "red": "#ff5555",
-                "yellow": "#f1fa8c"
-            },
-            "nord": {
-                "polar_night_0": "#2e3440",
-                "polar_night_1": "#3b4252",
-                "polar_night_2": "#434c5e",
-                "polar_night_3": "#4c566a",
-                "snow_storm_0": "#d8dee9",
-                "snow_storm_1": "#e5e9f0",
-                "snow_storm_2": "#eceff4",
-                "frost_0": "#8fbcbb",
-                "frost_1": "#88c0d0",
-                "frost_2": "#81a1c1",
-                "frost_3": "#5e81ac",
-                "aurora_0": "#bf616a",
-                "aurora_1": "#d08770",
-                "aurora_2": "#ebcb8b",
-                "aurora_3": "#a3be8c",
-                "aurora_4": "#b48ead"
-            },
-            "gruvbox": {
-                "bg": "#282828",
-                "fg": "#ebdbb2",
-                "red": "#cc241d",
-                "green": "#98971a",
-                "yellow": "#d79921",
-                "blue": "#458588",
-                "purple": "#b16286",
-                "aqua": "#689d6a",
-                "gray": "#a89984",
-                "orange": "#d65d0e"
-            },
-            "solarized": {
-                "base03": "#002b36",
-                "base02": "#073642",
-                "base01": "#586e75",
-                "base00": "#657b83",
-                "base0": "#839496",
-                "base1": "#93a1a1",
-                "base2": "#eee8d5",
-                "base3": "#fdf6e3",
-                "yellow": "#b58900",
-                "orange": "#cb4b16",
-                "red": "#dc322f",
-                "magenta": "#d33682",
-                "violet": "#6c71c4",
-                "blue": "#268bd2",
-                "cyan": "#2aa198",
-                "green": "#859900"
-            },
-            "catppuccin": {
-                "rosewater": "#f5e0dc",
-                "flamingo": "#f2cdcd",
-                "pink": "#f5c2e7",
-                "mauve": "#cba6f7",
-                "red": "#f38ba8",
-                "maroon": "#eba0ac",
-                "peach": "#fab387",
-                "yellow": "#f9e2af",
-                "green": "#a6e3a1",
-                "teal": "#94e2d5",
-                "sky": "#89dceb",
-                "sapphire": "#74c7ec",
-                "blue": "#89b4fa",
-                "lavender": "#b4befe",
-                "text": "#cdd6f4",
-                "subtext1": "#bac2de",
-                "subtext0": "#a6adc8",
-                "overlay2": "#9399b2",
-                "overlay1": "#7f849c",
-                "overlay0": "#6c7086",
-                "surface2": "#585b70",
-                "surface1": "#45475a",
-                "surface0": "#313244",
-                "base": "#1e1e2e",
-                "mantle": "#181825",
-                "crust": "#11111b"
-            }
-        }
+        self.config = {**_DEFAULTS, **config_data}
+        self.color_schemes = _COLOR_SCHEMES
+        self._reset_buffer()
     
     def generate_config(self) -> str:
         """Generate the complete tmux configuration"""
+        return "".join(self.iter_config())
+    
+    def iter_config(self) -> Iterator[str]:
+        """Yield the configuration in chunks: the header, then one per section"""
+        sections = None
+        # The cache renders with a plain generator and the stock palettes,
+        # so subclasses and replaced color_schemes render themselves
+        if type(self) is TmuxConfigGenerator and self.color_schemes is _COLOR_SCHEMES:
+            try:
+                cache_key = json.dumps([self.config[key] for key in _DEFAULTS])
+            except TypeError:
+                # Configs that can't be serialized bypass the cache
+                pass
+            else:
+                sections = _render_sections_cached(cache_key)
+        if sections is None:
+            sections = self._render_sections()
+        
+        self._reset_buffer()
         self._add_header()
-        self._add_core_settings()
-        self._add_appearance_settings()
-        self._add_behavior_settings()
-        self._add_terminal_integration()
-        self._add_vim_integration()
-        self._add_key_bindings()
-        self._add_plugin_configuration()
-        self._add_advanced_features()
-        self._add_footer()
-        
-        return "\n".join(self.lines)
+        yield self.buf.getvalue()
+        yield from sections
+    
+    def _render_sections(self) -> Tuple[str, ...]:
+        """Render each section after the timestamped header"""
+        chunks = []
+        for add_section in self._enabled_sections():
+            self._reset_buffer()
+            add_section()
+            chunks.append(self.buf.getvalue())
+        
+        return tuple(chunks)
+    
+    def _enabled_sections(self) -> List:
+        """Return the section writers that produce output for this config"""
+        cfg = self.config
+        sections = (
+            (self._add_core_settings, True),
+            (self._add_appearance_settings, True),
+            (self._add_behavior_settings, True),
+            (self._add_terminal_integration, True),
+            (self._add_vim_integration, cfg['vim_navigation'] or cfg['vim_copy_mode']),
+            (self._add_key_bindings, True),
+            (self._add_plugin_configuration, cfg['use_tpm'] and cfg['plugins']),
+            (self._add_advanced_features, cfg['enable_copy_paste'] or cfg['enable_logging']),
+            (self._add_footer, True),
+        )
+        return [add_section for add_section, enabled in sections if enabled]
+    
+    def _section(self, title: str):
+        """Emit the banner that opens a section"""
+        self._emit(f"{_BANNER}# {title}\n{_BANNER}\n")
+    
+    def _reset_buffer(self):
+        """Start a fresh output buffer"""
+        self.buf = io.StringIO()
+        self._emit = self.buf.write
     
     def _add_header(self):
         """Add configuration file header"""
-        self.lines.extend([
-            "# ═══════════════════════════════════════════════════════════════════",
-            "# Ultimate TMUX Configuration",
-            f"# Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "# Generated by: TMUX Ultimate Configuration Generator",
-            "# ═══════════════════════════════════════════════════════════════════",
-            "",
-            "# Reload configuration with Prefix + r",
-            "bind r source-file ~/.tmux.conf \\; display-message \"Config reloaded!\"",
-            ""
-        ])
+        self._emit(
+            f"{_BANNER}"
+            "# Ultimate TMUX Configuration\n"
+            f"# Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            "# Generated by: TMUX Ultimate Configuration Generator\n"
+            f"{_BANNER}"
+            "\n"
+        )
+        self._emit(_RELOAD_BINDING)
     
     def _add_core_settings(self):
         """Add core tmux settings"""
-        self.lines.extend([
-            "# ═══════════════════════════════════════════════════════════════════",
-            "# CORE SETTINGS",
-            "# ═══════════════════════════════════════════════════════════════════",
-            ""
-        ])
+        cfg = self.config
+        
+        self._section("CORE SETTINGS")
         
         # Prefix key configuration
-        prefix = self.config.get('prefix_key', 'C-b')
+        prefix = cfg['prefix_key']
         if prefix == 'custom':
-            prefix = self.config.get('custom_prefix', 'C-b')
+            prefix = cfg['custom_prefix']
         
         if prefix != 'C-b':
-            self.lines.extend([
-                "# Change prefix key",
-                "unbind C-b",
-                f"set-option -g prefix {prefix}",
-                f"bind-key {prefix} send-prefix",
-                ""
-            ])
+            self._emit(
+                "# Change prefix key\n"
+                "unbind C-b\n"
+                f"set-option -g prefix {prefix}\n"
+                f"bind-key {prefix} send-prefix\n"
+                "\n"
+            )
         
         # Mouse support
-        if self.config.get('enable_mouse', True):
-            self.lines.extend([
-                "# Enable mouse support",
-                "set -g mouse on",
-                ""
-            ])
+        if cfg['enable_mouse']:
+            self._emit(
+                "# Enable mouse support\n"
+                "set -g mouse on\n"
+                "\n"
+            )
     
     def _add_appearance_settings(self):
         """Add appearance and status bar settings"""
-        self.lines.extend([
-            "# ═══════════════════════════════════════════════════════════════════",
-            "# APPEARANCE & STATUS BAR",
-            "# ═══════════════════════════════════════════════════════════════════",
-            ""
-        ])
+        cfg = self.config
+        
+        self._section("APPEARANCE & STATUS BAR")
         
         # Pane border status - show current directory
-        self.lines.extend([
-            "# Pane border status - show current directory",
-            "set -g pane-border-status top",
-            "set -g pane-border-format '#P: #{b:pane_current_path}'",
-            ""
-        ])
+        self._emit(
+            "# Pane border status - show current directory\n"
+            "set -g pane-border-status top\n"
+            "set -g pane-border-format '#P: #{b:pane_current_path}'\n"
+            "\n"
+        )
         
         # Color support
-        if self.config.get('enable_256_colors', True):
-            self.lines.extend([
-                "# Enable 256 colors",
-                "set -g default-terminal \"screen-256color\"",
-                ""
-            ])
-        
-        if self.config.get('enable_true_colors', True):
-            self.lines.extend([
-                "# Enable true color support",
-                "set -ga terminal-overrides \",*256col*:Tc\"",
-                ""
-            ])
+        if cfg['enable_256_colors']:
+            self._emit(
+                "# Enable 256 colors\n"
+                "set -g default-terminal \"screen-256color\"\n"
+                "\n"
+            )
+        
+        if cfg['enable_true_colors']:
+            self._emit(
+                "# Enable true color support\n"
+                "set -ga terminal-overrides \",*256col*:Tc\"\n"
+                "\n"
+            )
         
         # Status bar position
-        position = self.config.get('status_position', 'bottom')
+        position = cfg['status_position']
         if position != 'bottom':
-            self.lines.extend([
-                f"# Status bar position",
-                f"set -g status-position {position}",
-                ""
-            ])
+            self._emit(
+                f"# Status bar position\n"
+                f"set -g status-position {position}\n"
+                "\n"
+            )
         
         # Color scheme
-        color_scheme = self.config.get('color_scheme', 'default')
+        color_scheme = cfg['color_scheme']
         if color_scheme != 'default':
             self._add_color_scheme(color_scheme)
         
@@ -225,345 +429,212 @@ class TmuxConfigGenerator:
         if scheme not in self.color_schemes:
             return
         
-        colors = self.color_schemes[scheme]
-        
-        self.lines.extend([
-            f"# {scheme.title()} Color Scheme",
-            ""
-        ])
-        
-        if scheme == "dracula":
-            self.lines.extend([
-                f"set -g status-bg '{colors['current_line']}'",
-                f"set -g status-fg '{colors['fg']}'",
-                f"set -g window-status-current-style 'bg={colors['purple']},fg={colors['bg']}'",
-                f"set -g pane-border-style 'fg={colors['comment']}'",
-                f"set -g pane-active-border-style 'fg={colors['purple']},bg={colors['purple']}'",
-                f"set -g pane-border-format-style 'fg={colors['fg']},bg={colors['comment']}'",
-                ""
-            ])
-        elif scheme == "nord":
-            self.lines.extend([
-                f"set -g status-bg '{colors['polar_night_0']}'",
-                f"set -g status-fg '{colors['snow_storm_0']}'",
-                f"set -g window-status-current-style 'bg={colors['frost_3']},fg={colors['snow_storm_2']}'",
-                f"set -g pane-border-style 'fg={colors['polar_night_2']}'",
-                f"set -g pane-active-border-style 'fg={colors['frost_1']},bg={colors['frost_1']}'",
-                f"set -g pane-border-format-style 'fg={colors['snow_storm_2']},bg={colors['polar_night_1']}'",
-                ""
-            ])
-        elif scheme == "gruvbox":
-            self.lines.extend([
-                f"set -g status-bg '{colors['bg']}'",
-                f"set -g status-fg '{colors['fg']}'",
-                f"set -g window-status-current-style 'bg={colors['orange']},fg={colors['bg']}'",
-                f"set -g pane-border-style 'fg={colors['gray']}'",
-                f"set -g pane-active-border-style 'fg={colors['orange']},bg={colors['orange']}'",
-                f"set -g pane-border-format-style 'fg={colors['fg']},bg={colors['gray']}'",
-                ""
-            ])
-        elif scheme == "solarized":
-            self.lines.extend([
-                f"set -g status-bg '{colors['base02']}'",
-                f"set -g status-fg '{colors['base0']}'",
-                f"set -g window-status-current-style 'bg={colors['blue']},fg={colors['base3']}'",
-                f"set -g pane-border-style 'fg={colors['base01']}'",
-                f"set -g pane-active-border-style 'fg={colors['blue']},bg={colors['blue']}'",
-                f"set -g pane-border-format-style 'fg={colors['base3']},bg={colors['base01']}'",
-                ""
-            ])
-        elif scheme == "catppuccin":
-            self.lines.extend([
-                f"set -g status-bg '{colors['base']}'",
-                f"set -g status-fg '{colors['text']}'",
-                f"set -g window-status-current-style 'bg={colors['mauve']},fg={colors['base']}'",
-                f"set -g pane-border-style 'fg={colors['surface0']}'",
-                f"set -g pane-active-border-style 'fg={colors['mauve']},bg={colors['mauve']}'",
-                f"set -g pane-border-format-style 'fg={colors['text']},bg={colors['surface0']}'",
-                ""
-            ])
+        self._emit(f"# {scheme.title()} Color Scheme\n\n")
+        template = _SCHEME_TEMPLATES.get(scheme)
+        if template:
+            self._emit(template.format_map(self.color_schemes[scheme]))
     
     def _add_status_bar_config(self):
         """Add status bar configuration"""
-        status_left = []
-        status_right = []
-        
-        # Left side - session info
-        if self.config.get('show_session_name', True):
-            status_left.append("#S")
-        
-        # Right side - system info
-        if self.config.get('show_hostname', False):
-            status_right.append("#H")
-        
-        if self.config.get('show_date', True):
-            status_right.append("%Y-%m-%d")
-        
-        if self.config.get('show_time', True):
-            status_right.append("%H:%M")
-        
-        if status_left or status_right:
-            self.lines.extend([
-                "# Status bar configuration",
-                f"set -g status-left '[{' | '.join(status_left)}] '",
-                f"set -g status-right ' {' | '.join(status_right)}'",
-                "set -g status-left-length 50",
-                "set -g status-right-length 50",
-                ""
-            ])
+        cfg = self.config
+        
+        mask = (
+            bool(cfg['show_session_name']) << 3
+            | bool(cfg['show_hostname']) << 2
+            | bool(cfg['show_date']) << 1
+            | bool(cfg['show_time'])
+        )
+        self._emit(_STATUS_BAR_BLOCKS[mask])
     
     def _add_behavior_settings(self):
         """Add behavior settings"""
-        self.lines.extend([
-            "# ═══════════════════════════════════════════════════════════════════",
-            "# BEHAVIOR SETTINGS",
-            "# ═══════════════════════════════════════════════════════════════════",
-            ""
-        ])
+        cfg = self.config
+        
+        self._section("BEHAVIOR SETTINGS")
         
         # History limit
-        history_limit = self.config.get('history_limit', 5000)
-        self.lines.extend([
-            f"# History buffer size",
-            f"set -g history-limit {history_limit}",
-            ""
-        ])
+        history_limit = cfg['history_limit']
+        self._emit(
+            f"# History buffer size\n"
+            f"set -g history-limit {history_limit}\n"
+            "\n"
+        )
         
         # Window indexing
-        base_index = self.config.get('base_index', 1)
+        base_index = cfg['base_index']
         if base_index != 0:
-            self.lines.extend([
-                "# Start windows and panes at 1, not 0",
-                f"set -g base-index {base_index}",
-                f"setw -g pane-base-index {base_index}",
-                ""
-            ])
+            self._emit(
+                "# Start windows and panes at 1, not 0\n"
+                f"set -g base-index {base_index}\n"
+                f"setw -g pane-base-index {base_index}\n"
+                "\n"
+            )
         
         # Automatic rename
-        if not self.config.get('automatic_rename', False):
-            self.lines.extend([
-                "# Disable automatic window renaming",
-                "set-option -g allow-rename off",
-                ""
-            ])
+        if not cfg['automatic_rename']:
+            self._emit(
+                "# Disable automatic window renaming\n"
+                "set-option -g allow-rename off\n"
+                "\n"
+            )
         
         # Renumber windows
-        if self.config.get('renumber_windows', True):
-            self.lines.extend([
-                "# Renumber windows when a window is closed",
-                "set -g renumber-windows on",
-                ""
-            ])
+        if cfg['renumber_windows']:
+            self._emit(
+                "# Renumber windows when a window is closed\n"
+                "set -g renumber-windows on\n"
+                "\n"
+            )
     
     def _add_terminal_integration(self):
         """Add terminal integration settings"""
-        self.lines.extend([
-            "# ═══════════════════════════════════════════════════════════════════",
-            "# TERMINAL INTEGRATION",
-            "# ═══════════════════════════════════════════════════════════════════",
-            ""
-        ])
+        cfg = self.config
+        
+        self._section("TERMINAL INTEGRATION")
         
         # Terminal mode
-        terminal_mode = self.config.get('terminal_mode', 'emacs')
+        terminal_mode = cfg['terminal_mode']
         if terminal_mode == 'vi':
-            self.lines.extend([
-                "# Use Vi mode",
-                "setw -g mode-keys vi",
-                "set -g status-keys vi",
-                ""
-            ])
+            self._emit(
+                "# Use Vi mode\n"
+                "setw -g mode-keys vi\n"
+                "set -g status-keys vi\n"
+                "\n"
+            )
     
     def _add_vim_integration(self):
         """Add Vim integration settings"""
-        if not (self.config.get('vim_navigation', False) or self.config.get('vim_copy_mode', False)):
-            return
+        cfg = self.config
         
-        self.lines.extend([
-            "# ═══════════════════════════════════════════════════════════════════",
-            "# VIM INTEGRATION",
-            "# ═══════════════════════════════════════════════════════════════════",
-            ""
-        ])
+        self._section("VIM INTEGRATION")
         
         # Vim navigation
-        if self.config.get('vim_navigation', False):
-            prefix = self.config.get('prefix_key', 'C-b')
-            if prefix == 'custom':
-                prefix = self.config.get('custom_prefix', 'C-b')
-            
-            self.lines.extend([
-                "# Vim-style pane navigation",
-                f"bind h select-pane -L",
-                f"bind j select-pane -D",
-                f"bind k select-pane -U",
-                f"bind l select-pane -R",
-                "",
-                "# Vim-style pane resizing",
-                f"bind -r H resize-pane -L 5",
-                f"bind -r J resize-pane -D 5",
-                f"bind -r K resize-pane -U 5",
-                f"bind -r L resize-pane -R 5",
-                ""
-            ])
+        if cfg['vim_navigation']:
+            self._emit(
+                "# Vim-style pane navigation\n"
+                f"bind h select-pane -L\n"
+                f"bind j select-pane -D\n"
+                f"bind k select-pane -U\n"
+                f"bind l select-pane -R\n"
+                "\n"
+                "# Vim-style pane resizing\n"
+                f"bind -r H resize-pane -L 5\n"
+                f"bind -r J resize-pane -D 5\n"
+                f"bind -r K resize-pane -U 5\n"
+                f"bind -r L resize-pane -R 5\n"
+                "\n"
+            )
         
         # Vim copy mode
-        if self.config.get('vim_copy_mode', False):
-            self.lines.extend([
-                "# Vim-style copy mode",
-                "bind P paste-buffer",
-                "bind-key -T copy-mode-vi v send-keys -X begin-selection",
-                "bind-key -T copy-mode-vi y send-keys -X copy-selection",
-                "bind-key -T copy-mode-vi r send-keys -X rectangle-toggle",
-                ""
-            ])
+        if cfg['vim_copy_mode']:
+            self._emit(
+                "# Vim-style copy mode\n"
+                "bind P paste-buffer\n"
+                "bind-key -T copy-mode-vi v send-keys -X begin-selection\n"
+                "bind-key -T copy-mode-vi y send-keys -X copy-selection\n"
+                "bind-key -T copy-mode-vi r send-keys -X rectangle-toggle\n"
+                "\n"
+            )
     
     def _add_key_bindings(self):
         """Add custom key bindings"""
-        self.lines.extend([
-            "# ═══════════════════════════════════════════════════════════════════",
-            "# KEY BINDINGS",
-            "# ═══════════════════════════════════════════════════════════════════",
-            ""
-        ])
-        
-        # Common useful bindings
-        self.lines.extend([
-            "# Split panes using | and -",
-            "bind | split-window -h",
-            "bind - split-window -v",
-            "unbind '\"'",
-            "unbind %",
-            "",
-            "# Switch panes using Alt+arrow without prefix",
-            "bind -n M-Left select-pane -L",
-            "bind -n M-Right select-pane -R",
-            "bind -n M-Up select-pane -U",
-            "bind -n M-Down select-pane -D",
-            ""
-        ])
+        cfg = self.config
+        
+        self._emit(_KEY_BINDINGS)
         
         # Pane synchronization
-        if self.config.get('enable_pane_synchronization', False):
-            self.lines.extend([
-                "# Toggle pane synchronization",
-                "bind S set-window-option synchronize-panes",
-                ""
-            ])
+        if cfg['enable_pane_synchronization']:
+            self._emit(
+                "# Toggle pane synchronization\n"
+                "bind S set-window-option synchronize-panes\n"
+                "\n"
+            )
     
     def _add_plugin_configuration(self):
         """Add plugin configuration"""
-        if not self.config.get('use_tpm', False):
-            return
-        
-        plugins = self.config.get('plugins', [])
-        if not plugins:
-            return
-        
-        self.lines.extend([
-            "# ═══════════════════════════════════════════════════════════════════",
-            "# PLUGIN CONFIGURATION",
-            "# ═══════════════════════════════════════════════════════════════════",
-            "",
-            "# List of plugins",
-            "set -g @plugin 'tmux-plugins/tpm'",
-            ""
-        ])
-        
-        # Plugin mappings
-        plugin_map = {
-            "tmux-sensible": "tmux-plugins/tmux-sensible",
-            "tmux-resurrect": "tmux-plugins/tmux-resurrect",
-            "tmux-continuum": "tmux-plugins/tmux-continuum",
-            "tmux-copycat": "tmux-plugins/tmux-copycat",
-            "tmux-yank": "tmux-plugins/tmux-yank",
-            "tmux-sidebar": "tmux-plugins/tmux-sidebar",
-            "tmux-battery": "tmux-plugins/tmux-battery",
-            "tmux-cpu": "tmux-plugins/tmux-cpu",
-            "tmux-net-speed": "tmux-plugins/tmux-net-speed"
-        }
-        
-        for plugin in plugins:
-            if plugin in plugin_map:
-                self.lines.append(f"set -g @plugin '{plugin_map[plugin]}'")
-        
-        self.lines.extend([
-            "",
-            "# Plugin configurations",
-            ""
-        ])
+        plugins = self.config['plugins']
+        
+        self._section("PLUGIN CONFIGURATION")
+        self._emit(
+            "# List of plugins\n"
+            "set -g @plugin 'tmux-plugins/tpm'\n"
+            "\n"
+        )
+        
+        enabled = set(plugins)
+        for plugin, repo in _PLUGIN_REPOS:
+            if plugin in enabled:
+                self._emit(f"set -g @plugin '{repo}'\n")
+        
+        self._emit(
+            "\n"
+            "# Plugin configurations\n"
+            "\n"
+        )
         
         # Plugin-specific configurations
-        if "tmux-continuum" in plugins and "tmux-resurrect" in plugins:
-            self.lines.extend([
-                "# tmux-continuum configuration",
-                "set -g @continuum-restore 'on'",
-                "set -g @continuum-save-interval '15'",
-                ""
-            ])
-        
-        if "tmux-yank" in plugins:
-            self.lines.extend([
-                "# tmux-yank configuration",
-                "set -g @yank_selection_mouse 'clipboard'",
-                ""
-            ])
+        if {"tmux-continuum", "tmux-resurrect"} <= enabled:
+            self._emit(
+                "# tmux-continuum configuration\n"
+                "set -g @continuum-restore 'on'\n"
+                "set -g @continuum-save-interval '15'\n"
+                "\n"
+            )
+        
+        if "tmux-yank" in enabled:
+            self._emit(
+                "# tmux-yank configuration\n"
+                "set -g @yank_selection_mouse 'clipboard'\n"
+                "\n"
+            )
         
         # TPM initialization
-        self.lines.extend([
-            "# Initialize TMUX plugin manager (keep this line at the very bottom of tmux.conf)",
-            "run '~/.tmux/plugins/tpm/tpm'",
-            ""
-        ])
+        self._emit(
+            "# Initialize TMUX plugin manager (keep this line at the very bottom of tmux.conf)\n"
+            "run '~/.tmux/plugins/tpm/tpm'\n"
+            "\n"
+        )
     
     def _add_advanced_features(self):
         """Add advanced features"""
-        advanced_features = [
-            self.config.get('enable_copy_paste', False),
-            self.config.get('enable_logging', False)
-        ]
+        cfg = self.config
         
-        if not any(advanced_features):
-            return
-        
-        self.lines.extend([
-            "# ═══════════════════════════════════════════════════════════════════",
-            "# ADVANCED FEATURES",
-            "# ═══════════════════════════════════════════════════════════════════",
-            ""
-        ])
+        self._section("ADVANCED FEATURES")
         
         # System clipboard integration
-        if self.config.get('enable_copy_paste', False):
-            self.lines.extend([
-                "# System clipboard integration",
-                "bind C-c run \"tmux save-buffer - | xclip -i -sel clipboard\"",
-                "bind C-v run \"tmux set-buffer \\\"$(xclip -o -sel clipboard)\\\"; tmux paste-buffer\"",
-                ""
-            ])
+        if cfg['enable_copy_paste']:
+            self._emit(
+                "# System clipboard integration\n"
+                "bind C-c run \"tmux save-buffer - | xclip -i -sel clipboard\"\n"
+                "bind C-v run \"tmux set-buffer \\\"$(xclip -o -sel clipboard)\\\"; tmux paste-buffer\"\n"
+                "\n"
+            )
         
         # Session logging
-        if self.config.get('enable_logging', False):
-            self.lines.extend([
-                "# Session logging",
-                "bind-key H pipe-pane -o 'cat >>~/tmux-#W.log' \\; display-message 'Started logging to ~/tmux-#W.log'",
-                "bind-key h pipe-pane \\; display-message 'Ended logging to ~/tmux-#W.log'",
-                ""
-            ])
+        if cfg['enable_logging']:
+            self._emit(
+                "# Session logging\n"
+                "bind-key H pipe-pane -o 'cat >>~/tmux-#W.log' \\; display-message 'Started logging to ~/tmux-#W.log'\n"
+                "bind-key h pipe-pane \\; display-message 'Ended logging to ~/tmux-#W.log'\n"
+                "\n"
+            )
     
     def _add_footer(self):
         """Add configuration file footer"""
-        self.lines.extend([
-            "# ═══════════════════════════════════════════════════════════════════",
-            "# END OF CONFIGURATION",
-            "# ═══════════════════════════════════════════════════════════════════",
-            "",
-            "# To apply changes:",
-            "# 1. Save this file as ~/.tmux.conf",
-            "# 2. Reload with: tmux source-file ~/.tmux.conf",
-            "# 3. Or use the reload binding: Prefix + r",
-            ""
-        ])
+        self._emit(_FOOTER)
+
+
+@lru_cache(maxsize=128)
+def _render_sections_cached(cache_key: str) -> Tuple[str, ...]:
+    """Render the config sections for JSON-encoded option values, memoized per config"""
+    config = dict(zip(_DEFAULTS, json.loads(cache_key)))
+    return TmuxConfigGenerator(config)._render_sections()
+
+
+def load_config(path: str) -> Dict:
+    """Load questionnaire responses from a JSON file"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
 
 
 def main():
@@ -571,13 +642,14 @@ def main():
     config_path = os.path.join(os.path.dirname(__file__), 'tmux_config.json')
     
     if not os.path.exists(config_path):
-        print("❌ Configuration file not found!")
-        print("Please run the questionnaire first: python tmux_questionnaire.py")
+        print(
+            "❌ Configuration file not found!\n"
+            "Please run the questionnaire first: python tmux_questionnaire.py"
+        )
         return
     
     # Load configuration
-    with open(config_path, 'r') as f:
-        config_data = json.load(f)
+    config_data = load_config(config_path)
     
     # Generate configuration
     generator = TmuxConfigGenerator(config_data)
@@ -585,20 +657,26 @@ def main():
     
     # Save configuration
     output_path = os.path.join(os.path.dirname(__file__), 'tmux.conf')
-    with open(output_path, 'w') as f:
-        f.write(tmux_config)
-    
-    print("🎉 TMUX configuration generated successfully!")
-    print(f"📄 Configuration saved to: {output_path}")
-    print("\n📋 Next steps:")
-    print("1. Review the generated configuration")
-    print("2. Copy to your home directory: cp tmux.conf ~/.tmux.conf")
-    print("3. If using TPM plugins, install them first:")
-    print("   git clone https://github.com/tmux-plugins/tpm ~/.tmux/plugins/tpm")
-    print("4. Reload tmux: tmux source-file ~/.tmux.conf")
-    print("5. If using plugins, install them with: Prefix + I")
+    data = memoryview(tmux_config.encode('utf-8'))
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
     
-    print("\n🚀 Your ultimate tmux configuration is ready!")
+    print(
+        "🎉 TMUX configuration generated successfully!\n"
+        f"📄 Configuration saved to: {output_path}\n"
+        "\n📋 Next steps:\n"
+        "1. Review the generated configuration\n"
+        "2. Copy to your home directory: cp tmux.conf ~/.tmux.conf\n"
+        "3. If using TPM plugins, install them first:\n"
+        "   git clone https://github.com/tmux-plugins/tpm ~/.tmux/plugins/tpm\n"
+        "4. Reload tmux: tmux source-file ~/.tmux.conf\n"
+        "5. If using plugins, install them with: Prefix + I\n"
+        "\n🚀 Your ultimate tmux configuration is ready!"
+    )
 
 
 if __name__ == "__main__":
@@ -4,12 +4,35 @@ Interactive TMUX Configuration Questionnaire
 Generates the ultimate tmux configuration file for Linux power users
 """
 
-import json
 import os
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any
+import re
+import sys
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
 from enum import Enum
 
+try:
+    from orjson import OPT_INDENT_2, dumps as _orjson_dumps, loads as _load_json
+
+    def _dump_json(obj: Any) -> bytes:
+        """Serialize obj as indented JSON"""
+        return _orjson_dumps(obj, option=OPT_INDENT_2)
+except ImportError:
+    def _dump_json(obj: Any) -> bytes:
+        """Serialize obj as indented JSON"""
+        import json
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    def _load_json(data: bytes) -> Any:
+        """Parse JSON data"""
+        import json
+        return json.loads(data)
+
+
+# Where the answers are saved for the generator to read
+_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tmux_config.json')
+
 
 class PrefixKey(Enum):
     CTRL_B = "C-b"
@@ -33,7 +56,11 @@ class TerminalMode(Enum):
     VI = "vi"
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TmuxConfig:
     """Data class to hold all tmux configuration options"""
     
@@ -44,7 +71,7 @@ class TmuxConfig:
     
     # Appearance
     color_scheme: str = "default"
-    custom_colors: Dict[str, str] = None
+    custom_colors: Dict[str, str] = field(default_factory=dict)
     show_time: bool = True
     show_date: bool = True
     show_hostname: bool = False
@@ -69,24 +96,400 @@ class TmuxConfig:
     
     # Plugins
     use_tpm: bool = True
-    plugins: List[str] = None
+    plugins: List[str] = field(default_factory=lambda: [
+        "tmux-sensible", "tmux-resurrect", "tmux-continuum", "tmux-copycat", "tmux-yank"
+    ])
     
     # Advanced Features
     enable_copy_paste: bool = False
-    custom_key_bindings: List[Dict[str, str]] = None
+    custom_key_bindings: List[Dict[str, str]] = field(default_factory=list)
     status_position: str = "bottom"
     
     # Development Features
     enable_pane_synchronization: bool = False
     enable_logging: bool = True
     
-    def __post_init__(self):
-        if self.custom_colors is None:
-            self.custom_colors = {}
-        if self.plugins is None:
-            self.plugins = ["tmux-sensible", "tmux-resurrect", "tmux-continuum", "tmux-copycat", "tmux-yank"]
-        if self.custom_key_bindings is None:
-            self.custom_key_bindings = []
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the options as a plain dict for saving as JSON"""
+        return {name: getattr(self, name) for name in _CONFIG_FIELDS}
+
+
+# Option names in declaration order
+_CONFIG_FIELDS = tuple(f.name for f in fields(TmuxConfig))
+
+
+class Question(NamedTuple):
+    """A single questionnaire question"""
+    key: str
+    question: str
+    type: str
+    choices: Tuple[tuple, ...] = ()
+    default: Any = None
+    min: int = 0
+    max: int = 999999
+    # (option, value): only ask when that option already has that value
+    condition: Optional[Tuple[str, Any]] = None
+    help: Optional[str] = None
+
+
+# Questionnaire sections, asked in order
+QUESTIONS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({
+        "section": "🔧 Core Settings",
+        "questions": (
+            Question(
+                key="prefix_key",
+                question="What prefix key would you like to use?",
+                type="choice",
+                choices=(
+                    ("C-b", "Ctrl+B (default)"),
+                    ("C-a", "Ctrl+A (popular alternative)"),
+                    ("C-Space", "Ctrl+Space (recommended for Vim users)"),
+                    ("custom", "Custom prefix key")
+                ),
+                default="C-b",
+                help="prefix_key"
+            ),
+            Question(
+                key="custom_prefix",
+                question="Enter your custom prefix key (e.g., 'C-x'):",
+                type="text",
+                default="",
+                condition=("prefix_key", "custom"),
+                help="custom_prefix"
+            ),
+            Question(
+                key="enable_mouse",
+                question="Enable mouse support? (click to select panes, resize with drag)",
+                type="bool",
+                default=True,
+                help="enable_mouse"
+            )
+        )
+    }),
+    MappingProxyType({
+        "section": "🎨 Appearance & Status Bar",
+        "questions": (
+            Question(
+                key="color_scheme",
+                question="Choose a color scheme:",
+                type="choice_colored",
+                choices=(
+                    ("default", "Default tmux colors"),
+                    ("dracula", "Dracula theme"),
+                    ("nord", "Nord theme"),
+                    ("gruvbox", "Gruvbox theme"),
+                    ("solarized", "Solarized theme"),
+                    ("catppuccin", "Catppuccin theme"),
+                    ("custom", "Custom colors")
+                ),
+                default="default",
+                help="color_scheme"
+            ),
+            Question(
+                key="show_time",
+                question="Show current time in status bar?",
+                type="bool",
+                default=True,
+                help="show_time"
+            ),
+            Question(
+                key="show_date",
+                question="Show current date in status bar?",
+                type="bool",
+                default=True,
+                help="show_date"
+            ),
+            Question(
+                key="show_hostname",
+                question="Show hostname in status bar?",
+                type="bool",
+                default=False,
+                help="show_hostname"
+            ),
+            Question(
+                key="status_position",
+                question="Status bar position:",
+                type="choice",
+                choices=(
+                    ("bottom", "Bottom"),
+                    ("top", "Top")
+                ),
+                default="bottom",
+                help="status_position"
+            )
+        )
+    }),
+    MappingProxyType({
+        "section": "⚙️ Behavior & Performance",
+        "questions": (
+            Question(
+                key="history_limit",
+                question="History buffer size (lines to keep in scrollback):",
+                type="number",
+                default=5000,
+                min=1000,
+                max=50000,
+                help="history_limit"
+            ),
+            Question(
+                key="automatic_rename",
+                question="Allow automatic window renaming?",
+                type="bool",
+                default=False,
+                help="automatic_rename"
+            ),
+            Question(
+                key="renumber_windows",
+                question="Automatically renumber windows when one is closed?",
+                type="bool",
+                default=True,
+                help="renumber_windows"
+            ),
+            Question(
+                key="base_index",
+                question="Starting index for windows (0 or 1):",
+                type="choice",
+                choices=(
+                    (0, "Start at 0"),
+                    (1, "Start at 1 (recommended)")
+                ),
+                default=1,
+                help="base_index"
+            )
+        )
+    }),
+    MappingProxyType({
+        "section": "🖥️ Terminal Integration",
+        "questions": (
+            Question(
+                key="terminal_mode",
+                question="Status line key bindings mode:",
+                type="choice",
+                choices=(
+                    ("emacs", "Emacs mode"),
+                    ("vi", "Vi mode")
+                ),
+                default="vi",
+                help="terminal_mode"
+            ),
+            Question(
+                key="enable_256_colors",
+                question="Enable 256 color support?",
+                type="bool",
+                default=True,
+                help="enable_256_colors"
+            ),
+            Question(
+                key="enable_true_colors",
+                question="Enable true color (24-bit) support?",
+                type="bool",
+                default=True,
+                help="enable_true_colors"
+            )
+        )
+    }),
+    MappingProxyType({
+        "section": "🏗️ Vim Integration",
+        "questions": (
+            Question(
+                key="vim_navigation",
+                question="Enable Vim-style pane navigation (h,j,k,l)?",
+                type="bool",
+                default=False,
+                help="vim_navigation"
+            ),
+            Question(
+                key="vim_copy_mode",
+                question="Enable Vim-style copy mode bindings?",
+                type="bool",
+                default=True,
+                help="vim_copy_mode"
+            )
+        )
+    }),
+    MappingProxyType({
+        "section": "🔌 Plugin Management",
+        "questions": (
+            Question(
+                key="use_tpm",
+                question="Use TPM (Tmux Plugin Manager)?",
+                type="bool",
+                default=True,
+                help="use_tpm"
+            ),
+            Question(
+                key="plugins",
+                question="Select plugins to install:",
+                type="multiselect",
+                choices=(
+                    ("tmux-sensible", "Sensible defaults"),
+                    ("tmux-resurrect", "Restore sessions after restart"),
+                    ("tmux-continuum", "Continuous saving of sessions"),
+                    ("tmux-copycat", "Enhanced search"),
+                    ("tmux-yank", "System clipboard integration"),
+                    ("tmux-sidebar", "File tree sidebar"),
+                    ("tmux-battery", "Battery status"),
+                    ("tmux-cpu", "CPU usage display"),
+                    ("tmux-net-speed", "Network speed display")
+                ),
+                condition=("use_tpm", True),
+                help="plugins"
+            )
+        )
+    }),
+    MappingProxyType({
+        "section": "🚀 Advanced Features",
+        "questions": (
+            Question(
+                key="enable_pane_synchronization",
+                question="Enable pane synchronization toggle?",
+                type="bool",
+                default=False,
+                help="enable_pane_synchronization"
+            ),
+            Question(
+                key="enable_logging",
+                question="Enable session logging capabilities?",
+                type="bool",
+                default=True,
+                help="enable_logging"
+            )
+        )
+    })
+)
+
+# Each question by the option it sets
+_QUESTIONS_BY_KEY: Mapping[str, Question] = MappingProxyType({
+    question.key: question for section in QUESTIONS for question in section["questions"]
+})
+
+# Expected type of every option, for options no question covers
+_FIELD_TYPES: Mapping[str, type] = MappingProxyType({
+    name: type(value) for name, value in TmuxConfig().to_dict().items()
+})
+
+_TYPE_NAMES = {bool: "true or false", int: "a whole number", str: "a string", list: "a list", dict: "a JSON object"}
+
+
+def _format_choice(value: Any) -> str:
+    """Show a choice value the way it is written in JSON"""
+    return f'"{value}"' if isinstance(value, str) else str(value)
+
+
+def answer_error(key: str, value: Any) -> Optional[str]:
+    """Return why value is not an accepted answer for option key, or None if it is"""
+    question = _QUESTIONS_BY_KEY.get(key)
+    if question is None:
+        # type() rather than isinstance() so that true/false is not taken as a number
+        expected = _FIELD_TYPES[key]
+        if type(value) is not expected:
+            return f"expected {_TYPE_NAMES[expected]}"
+        return None
+    
+    if question.type == "bool":
+        if type(value) is not bool:
+            return "expected true or false"
+    elif question.type in ("choice", "choice_colored"):
+        if not any(type(value) is type(choice) and value == choice for choice, _ in question.choices):
+            return "expected one of " + ", ".join(_format_choice(choice) for choice, _ in question.choices)
+    elif question.type == "number":
+        if type(value) is not int or not question.min <= value <= question.max:
+            return f"expected a whole number from {question.min} to {question.max}"
+    elif question.type == "multiselect":
+        allowed = {choice for choice, _ in question.choices}
+        if type(value) is not list or not all(isinstance(item, str) and item in allowed for item in value):
+            return "expected a list drawn from " + ", ".join(_format_choice(choice) for choice, _ in question.choices)
+    elif question.type == "text":
+        if type(value) is not str:
+            return "expected a string"
+    return None
+
+
+# Help text for each configuration option
+HELP_TEXTS: Mapping[str, str] = MappingProxyType({
+    "prefix_key": "The prefix key is pressed before all tmux commands. Default is Ctrl+B, but many users prefer Ctrl+A (like GNU Screen) or Ctrl+Space for easier typing.",
+    "custom_prefix": "Enter a custom prefix key using tmux syntax (e.g., 'C-x' for Ctrl+X, 'M-a' for Alt+A).",
+    "enable_mouse": "Mouse support allows you to click to select panes/windows, drag to resize panes, and scroll with the mouse wheel. Useful for beginners but some power users prefer keyboard-only.",
+    "color_scheme": "Choose a color theme for tmux. This affects the status bar, pane borders, and window indicators. Popular themes include Dracula (dark purple), Nord (blue-gray), and Gruvbox (retro).",
+    "show_time": "Display current time (HH:MM format) in the status bar. Useful for keeping track of time while working in terminal.",
+    "show_date": "Display current date (YYYY-MM-DD format) in the status bar alongside or instead of time.",
+    "show_hostname": "Display the hostname/computer name in status bar. Useful when working on multiple remote servers.",
+    "status_position": "Position of the status bar. 'Bottom' is traditional, 'Top' can be useful if you want status info more visible.",
+    "history_limit": "Number of lines kept in scrollback buffer per window. Higher values use more memory but let you scroll back further. 5000 is a good balance.",
+    "automatic_rename": "Whether tmux automatically renames windows based on the running command. 'No' gives you more control over window names.",
+    "renumber_windows": "When windows are closed, automatically renumber remaining windows to eliminate gaps (e.g., 1,3,5 becomes 1,2,3).",
+    "base_index": "Starting number for windows and panes. '1' is more intuitive since most people don't think of '0' as the first item.",
+    "terminal_mode": "Key binding style for command line editing in tmux. 'Emacs' uses Ctrl+A/E to move, 'Vi' uses h/j/k/l and modes like Vim.",
+    "enable_256_colors": "Enables 256-color support for better color themes and syntax highlighting. Most modern terminals support this.",
+    "enable_true_colors": "Enables 24-bit true color support for even better colors. Newer feature, ensure your terminal supports it.",
+    "vim_navigation": "Use h/j/k/l keys (after prefix) to navigate between panes, just like in Vim. Natural for Vim users.",
+    "vim_copy_mode": "Use Vim-style keys in copy mode: 'v' to select, 'y' to yank/copy. Makes copying text more familiar for Vim users.",
+    "use_tpm": "TPM (Tmux Plugin Manager) lets you easily install and manage tmux plugins. Highly recommended for extended functionality.",
+    "plugins": "Popular tmux plugins: sensible (better defaults), resurrect (save sessions), continuum (auto-save), copycat (better search), yank (clipboard), sidebar (file browser), monitoring plugins.",
+    "enable_copy_paste": "Integration with system clipboard using xclip/pbcopy. Lets you copy from tmux to other applications easily.",
+    "enable_pane_synchronization": "Adds a key binding to toggle synchronization across all panes in a window. When enabled, typing in one pane types in all panes simultaneously.",
+    "enable_logging": "Adds key bindings to start/stop logging all terminal output to files. Useful for keeping records of terminal sessions."
+})
+
+# Help texts formatted as shown by _show_help
+_HELP_MESSAGES = {key: f"\n📚 Help: {text}\n\n" for key, text in HELP_TEXTS.items()}
+_NO_HELP_MESSAGE = "\n📚 Help: No help available for this option.\n\n"
+
+
+# ANSI color codes used to preview each color scheme
+COLOR_SCHEMES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "default": MappingProxyType({"bg": "\033[40m", "fg": "\033[37m", "accent": "\033[36m"}),
+    "dracula": MappingProxyType({"bg": "\033[48;2;40;42;54m", "fg": "\033[38;2;248;248;242m", "accent": "\033[38;2;189;147;249m"}),
+    "nord": MappingProxyType({"bg": "\033[48;2;46;52;64m", "fg": "\033[38;2;216;222;233m", "accent": "\033[38;2;94;129;172m"}),
+    "gruvbox": MappingProxyType({"bg": "\033[48;2;40;40;40m", "fg": "\033[38;2;235;219;178m", "accent": "\033[38;2;214;93;14m"}),
+    "solarized": MappingProxyType({"bg": "\033[48;2;0;43;54m", "fg": "\033[38;2;131;148;150m", "accent": "\033[38;2;38;139;210m"}),
+    "catppuccin": MappingProxyType({"bg": "\033[48;2;30;30;46m", "fg": "\033[38;2;205;214;244m", "accent": "\033[38;2;203;166;247m"}),
+    "custom": MappingProxyType({"bg": "\033[45m", "fg": "\033[37m", "accent": "\033[33m"})
+})
+
+# Background and foreground codes combined, ready to prefix a choice
+_SCHEME_PREFIXES = MappingProxyType({name: colors["bg"] + colors["fg"] for name, colors in COLOR_SCHEMES.items()})
+_RESET = "\033[0m"
+
+# Accepted answers to yes/no questions, and the hint shown for each default
+_YES = frozenset(("y", "yes"))
+_NO = frozenset(("n", "no"))
+_YN_STR = {True: "Y/n", False: "y/N"}
+
+# Fixed messages shown by the questionnaire
+_WELCOME = (
+    "🚀 Welcome to the Ultimate TMUX Configuration Generator!\n"
+    f"{'=' * 60}\n"
+    "This questionnaire will help you create the perfect tmux configuration\n"
+    "for your Linux power user setup.\n"
+    "\n📚 Type '?' at any prompt for help about that option.\n\n"
+)
+_SECTION_RULE = "-" * 40
+_INVALID_YES_NO = "Please enter 'y' or 'n' (or '?' for help)\n"
+_INVALID_YES_NO_NO_HELP = "Please enter 'y' or 'n'\n"
+_INVALID_NUMBER = "Please enter a valid number (or '?' for help)\n"
+_COMPLETE = f"\n{'=' * 60}\n🎉 Configuration complete!\n{'=' * 60}\n"
+_NEXT_STEPS = (
+    "\nNext steps:\n"
+    "1. Run the tmux config generator to create your .tmux.conf file\n"
+    "2. Copy the generated config to ~/.tmux.conf\n"
+    "3. Reload tmux or start a new session to apply changes\n"
+)
+
+# Comma-separated choice numbers, where empty entries are ignored
+_SELECTION_RE = re.compile(r"\s*(?:\d+\s*)?(?:,\s*(?:\d+\s*)?)*")
+_NUMBER_RE = re.compile(r"\d+")
+
+
+def _prompt(message: str) -> str:
+    """Show a prompt and read one line of input, like input()"""
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line[:-1] if line.endswith("\n") else line
 
 
 class TmuxQuestionnaire:
@@ -94,424 +497,192 @@ class TmuxQuestionnaire:
     
     def __init__(self):
         self.config = TmuxConfig()
+        # Options that already have an answer and are not asked again
+        self.answered = frozenset()
         self.questions = self._initialize_questions()
         self.help_texts = self._initialize_help_texts()
         self.color_schemes = self._initialize_color_schemes()
-    
-    def _initialize_questions(self) -> List[Dict[str, Any]]:
-        """Initialize the questionnaire structure"""
-        return [
-            {
-                "section": "🔧 Core Settings",
-                "questions": [
-                    {
-                        "key": "prefix_key",
-                        "question": "What prefix key would you like to use?",
-                        "type": "choice",
-                        "choices": [
-                            ("C-b", "Ctrl+B (default)"),
-                            ("C-a", "Ctrl+A (popular alternative)"),
-                            ("C-Space", "Ctrl+Space (recommended for Vim users)"),
-                            ("custom", "Custom prefix key")
-                        ],
-                        "default": "C-b",
-                        "help": "prefix_key"
-                    },
-                    {
-                        "key": "custom_prefix",
-                        "question": "Enter your custom prefix key (e.g., 'C-x'):",
-                        "type": "text",
-                        "condition": lambda cfg: cfg.prefix_key == "custom",
-                        "help": "custom_prefix"
-                    },
-                    {
-                        "key": "enable_mouse",
-                        "question": "Enable mouse support? (click to select panes, resize with drag)",
-                        "type": "bool",
-                        "default": True,
-                        "help": "enable_mouse"
-                    }
-                ]
-            },
-            {
-                "section": "🎨 Appearance & Status Bar",
-                "questions": [
-                    {
-                        "key": "color_scheme",
-                        "question": "Choose a color scheme:",
-                        "type": "choice_colored",
-                        "choices": [
-                            ("default", "Default tmux colors"),
-                            ("dracula", "Dracula theme"),
-                            ("nord", "Nord theme"),
-                            ("gruvbox", "Gruvbox theme"),
-                            ("solarized", "Solarized theme"),
-                            ("catppuccin", "Catppuccin theme"),
-                            ("custom", "Custom colors")
-                        ],
-                        "default": "default",
-                        "help": "color_scheme"
-                    },
-                    {
-                        "key": "show_time",
-                        "question": "Show current time in status bar?",
-                        "type": "bool",
-                        "default": True,
-                        "help": "show_time"
-                    },
-                    {
-                        "key": "show_date",
-                        "question": "Show current date in status bar?",
-                        "type": "bool",
-                        "default": True,
-                        "help": "show_date"
-                    },
-                    {
-                        "key": "show_hostname",
-                        "question": "Show hostname in status bar?",
-                        "type": "bool",
-                        "default": False,
-                        "help": "show_hostname"
-                    },
-                    {
-                        "key": "status_position",
-                        "question": "Status bar position:",
-                        "type": "choice",
-                        "choices": [
-                            ("bottom", "Bottom"),
-                            ("top", "Top")
-                        ],
-                        "default": "bottom",
-                        "help": "status_position"
-                    }
-                ]
-            },
-            {
-                "section": "⚙️ Behavior & Performance",
-                "questions": [
-                    {
-                        "key": "history_limit",
-                        "question": "History buffer size (lines to keep in scrollback):",
-                        "type": "number",
-                        "default": 5000,
-                        "min": 1000,
-                        "max": 50000,
-                        "help": "history_limit"
-                    },
-                    {
-                        "key": "automatic_rename",
-                        "question": "Allow automatic window renaming?",
-                        "type": "bool",
-                        "default": False,
-                        "help": "automatic_rename"
-                    },
-                    {
-                        "key": "renumber_windows",
-                        "question": "Automatically renumber windows when one is closed?",
-                        "type": "bool",
-                        "default": True,
-                        "help": "renumber_windows"
-                    },
-                    {
-                        "key": "base_index",
-                        "question": "Starting index for windows (0 or 1):",
-                        "type": "choice",
-                        "choices": [
-                            (0, "Start at 0"),
-                            (1, "Start at 1 (recommended)")
-                        ],
-                        "default": 1,
-                        "help": "base_index"
-                    }
-                ]
-            },
-            {
-                "section": "🖥️ Terminal Integration",
-                "questions": [
-                    {
-                        "key": "terminal_mode",
-                        "question": "Status line key bindings mode:",
-                        "type": "choice",
-                        "choices": [
-                            ("emacs", "Emacs mode"),
-                            ("vi", "Vi mode")
-                        ],
-                        "default": "vi",
-                        "help": "terminal_mode"
-                    },
-                    {
-                        "key": "enable_256_colors",
-                        "question": "Enable 256 color support?",
-                        "type": "bool",
-                        "default": True,
-                        "help": "enable_256_colors"
-                    },
-                    {
-                        "key": "enable_true_colors",
-                        "question": "Enable true color (24-bit) support?",
-                        "type": "bool",
-                        "default": True,
-                        "help": "enable_true_colors"
-                    }
-                ]
-            },
-            {
-                "section": "🏗️ Vim Integration",
-                "questions": [
-                    {
-                        "key": "vim_navigation",
-                        "question": "Enable Vim-style pane navigation (h,j,k,l)?",
-                        "type": "bool",
-                        "default": False,
-                        "help": "vim_navigation"
-                    },
-                    {
-                        "key": "vim_copy_mode",
-                        "question": "Enable Vim-style copy mode bindings?",
-                        "type": "bool",
-                        "default": True,
-                        "help": "vim_copy_mode"
-                    }
-                ]
-            },
-            {
-                "section": "🔌 Plugin Management",
-                "questions": [
-                    {
-                        "key": "use_tpm",
-                        "question": "Use TPM (Tmux Plugin Manager)?",
-                        "type": "bool",
-                        "default": True,
-                        "help": "use_tpm"
-                    },
-                    {
-                        "key": "plugins",
-                        "question": "Select plugins to install:",
-                        "type": "multiselect",
-                        "choices": [
-                            ("tmux-sensible", "Sensible defaults"),
-                            ("tmux-resurrect", "Restore sessions after restart"),
-                            ("tmux-continuum", "Continuous saving of sessions"),
-                            ("tmux-copycat", "Enhanced search"),
-                            ("tmux-yank", "System clipboard integration"),
-                            ("tmux-sidebar", "File tree sidebar"),
-                            ("tmux-battery", "Battery status"),
-                            ("tmux-cpu", "CPU usage display"),
-                            ("tmux-net-speed", "Network speed display")
-                        ],
-                        "condition": lambda cfg: cfg.use_tpm,
-                        "help": "plugins"
-                    }
-                ]
-            },
-            {
-                "section": "🚀 Advanced Features",
-                "questions": [
-                    {
-                        "key": "enable_pane_synchronization",
-                        "question": "Enable pane synchronization toggle?",
-                        "type": "bool",
-                        "default": False,
-                        "help": "enable_pane_synchronization"
-                    },
-                    {
-                        "key": "enable_logging",
-                        "question": "Enable session logging capabilities?",
-                        "type": "bool",
-                        "default": True,
-                        "help": "enable_logging"
-                    }
-                ]
-            }
-        ]
-    
-    def _initialize_help_texts(self) -> Dict[str, str]:
-        """Initialize help text for each configuration option"""
-        return {
-            "prefix_key": "The prefix key is pressed before all tmux commands. Default is Ctrl+B, but many users prefer Ctrl+A (like GNU Screen) or Ctrl+Space for easier typing.",
-            "custom_prefix": "Enter a custom prefix key using tmux syntax (e.g., 'C-x' for Ctrl+X, 'M-a' for Alt+A).",
-            "enable_mouse": "Mouse support allows you to click to select panes/windows, drag to resize panes, and scroll with the mouse wheel. Useful for beginners but some power users prefer keyboard-only.",
-            "color_scheme": "Choose a color theme for tmux. This affects the status bar, pane borders, and window indicators. Popular themes include Dracula (dark purple), Nord (blue-gray), and Gruvbox (retro).",
-            "show_time": "Display current time (HH:MM format) in the status bar. Useful for keeping track of time while working in terminal.",
-            "show_date": "Display current date (YYYY-MM-DD format) in the status bar alongside or instead of time.",
-            "show_hostname": "Display the hostname/computer name in status bar. Useful when working on multiple remote servers.",
-            "status_position": "Position of the status bar. 'Bottom' is traditional, 'Top' can be useful if you want status info more visible.",
-            "history_limit": "Number of lines kept in scrollback buffer per window. Higher values use more memory but let you scroll back further. 5000 is a good balance.",
-            "automatic_rename": "Whether tmux automatically renames windows based on the running command. 'No' gives you more control over window names.",
-            "renumber_windows": "When windows are closed, automatically renumber remaining windows to eliminate gaps (e.g., 1,3,5 becomes 1,2,3).",
-            "base_index": "Starting number for windows and panes. '1' is more intuitive since most people don't think of '0' as the first item.",
-            "terminal_mode": "Key binding style for command line editing in tmux. 'Emacs' uses Ctrl+A/E to move, 'Vi' uses h/j/k/l and modes like Vim.",
-            "enable_256_colors": "Enables 256-color support for better color themes and syntax highlighting. Most modern terminals support this.",
-            "enable_true_colors": "Enables 24-bit true color support for even better colors. Newer feature, ensure your terminal supports it.",
-            "vim_navigation": "Use h/j/k/l keys (after prefix) to navigate between panes, just like in Vim. Natural for Vim users.",
-            "vim_copy_mode": "Use Vim-style keys in copy mode: 'v' to select, 'y' to yank/copy. Makes copying text more familiar for Vim users.",
-            "use_tpm": "TPM (Tmux Plugin Manager) lets you easily install and manage tmux plugins. Highly recommended for extended functionality.",
-            "plugins": "Popular tmux plugins: sensible (better defaults), resurrect (save sessions), continuum (auto-save), copycat (better search), yank (clipboard), sidebar (file browser), monitoring plugins.",
-            "enable_copy_paste": "Integration with system clipboard using xclip/pbcopy. Lets you copy from tmux to other applications easily.",
-            "enable_pane_synchronization": "Adds a key binding to toggle synchronization across all panes in a window. When enabled, typing in one pane types in all panes simultaneously.",
-            "enable_logging": "Adds key bindings to start/stop logging all terminal output to files. Useful for keeping records of terminal sessions."
+        # Asks a question of each type and returns the answer
+        self._dispatch = {
+            "bool": self._dispatch_bool,
+            "choice": self._dispatch_choice,
+            "choice_colored": self._dispatch_choice_colored,
+            "multiselect": self._dispatch_multiselect,
+            "number": self._dispatch_number,
+            "text": self._dispatch_text,
         }
     
-    def _initialize_color_schemes(self) -> Dict[str, Dict[str, str]]:
-        """Initialize ANSI color codes for each color scheme"""
-        return {
-            "default": {"bg": "\033[40m", "fg": "\033[37m", "accent": "\033[36m"},
-            "dracula": {"bg": "\033[48;2;40;42;54m", "fg": "\033[38;2;248;248;242m", "accent": "\033[38;2;189;147;249m"},
-            "nord": {"bg": "\033[48;2;46;52;64m", "fg": "\033[38;2;216;222;233m", "accent": "\033[38;2;94;129;172m"},
-            "gruvbox": {"bg": "\033[48;2;40;40;40m", "fg": "\033[38;2;235;219;178m", "accent": "\033[38;2;214;93;14m"},
-            "solarized": {"bg": "\033[48;2;0;43;54m", "fg": "\033[38;2;131;148;150m", "accent": "\033[38;2;38;139;210m"},
-            "catppuccin": {"bg": "\033[48;2;30;30;46m", "fg": "\033[38;2;205;214;244m", "accent": "\033[38;2;203;166;247m"},
-            "custom": {"bg": "\033[45m", "fg": "\033[37m", "accent": "\033[33m"}
-        }
+    def _initialize_questions(self) -> Tuple[Mapping[str, Any], ...]:
+        """Return the questionnaire structure"""
+        return QUESTIONS
+    
+    def _initialize_help_texts(self) -> Mapping[str, str]:
+        """Return help text for each configuration option"""
+        return HELP_TEXTS
+    
+    def _initialize_color_schemes(self) -> Mapping[str, Mapping[str, str]]:
+        """Return ANSI color codes for each color scheme"""
+        return COLOR_SCHEMES
     
     def _show_help(self, help_key: str):
         """Display help text for a configuration option"""
-        help_text = self.help_texts.get(help_key, "No help available for this option.")
-        print(f"\n📚 Help: {help_text}\n")
+        sys.stdout.write(_HELP_MESSAGES.get(help_key, _NO_HELP_MESSAGE))
     
     def run_questionnaire(self) -> TmuxConfig:
         """Run the interactive questionnaire"""
-        print("🚀 Welcome to the Ultimate TMUX Configuration Generator!")
-        print("=" * 60)
-        print("This questionnaire will help you create the perfect tmux configuration")
-        print("for your Linux power user setup.")
-        print("\n📚 Type '?' at any prompt for help about that option.\n")
-        
+        # The welcome and each section header are written just before the
+        # first question that is actually asked, so reused answers don't
+        # leave empty sections behind
+        welcomed = False
         for section in self.questions:
-            print(f"\n{section['section']}")
-            print("-" * 40)
+            header_shown = False
             
             for question in section['questions']:
-                # Check if question should be shown based on condition
-                if 'condition' in question and not question['condition'](self.config):
+                if question.key in self.answered:
+                    continue
+                
+                # Skip the question unless its (option, value) condition holds
+                condition = question.condition
+                if condition and getattr(self.config, condition[0]) != condition[1]:
                     continue
                 
+                if not welcomed:
+                    sys.stdout.write(_WELCOME)
+                    welcomed = True
+                if not header_shown:
+                    sys.stdout.write(f"\n{section['section']}\n{_SECTION_RULE}\n")
+                    header_shown = True
                 self._ask_question(question)
         
         return self.config
     
-    def _ask_question(self, question: Dict[str, Any]):
-        """Ask a single question and update config"""
-        key = question['key']
-        question_text = question['question']
-        question_type = question['type']
-        
-        help_key = question.get('help')
+    def reuse_answers(self, answers: Mapping[str, Any]):
+        """Start from previously saved answers and only ask the questions they lack
         
-        if question_type == "bool":
-            default = question.get('default', False)
-            answer = self._ask_yes_no(question_text, default, help_key)
-            setattr(self.config, key, answer)
-            
-        elif question_type == "choice":
-            choices = question['choices']
-            default = question.get('default')
-            answer = self._ask_choice(question_text, choices, default, help_key)
-            setattr(self.config, key, answer)
-            
-        elif question_type == "choice_colored":
-            choices = question['choices']
-            default = question.get('default')
-            answer = self._ask_choice_colored(question_text, choices, default, help_key)
-            setattr(self.config, key, answer)
-            
-        elif question_type == "multiselect":
-            choices = question['choices']
-            answers = self._ask_multiselect(question_text, choices, help_key)
-            setattr(self.config, key, answers)
-            
-        elif question_type == "number":
-            default = question.get('default', 0)
-            min_val = question.get('min', 0)
-            max_val = question.get('max', 999999)
-            answer = self._ask_number(question_text, default, min_val, max_val, help_key)
-            setattr(self.config, key, answer)
-            
-        elif question_type == "text":
-            default = question.get('default', "")
-            answer = self._ask_text(question_text, default, help_key)
-            setattr(self.config, key, answer)
+        Answers that are not accepted for their option are dropped, so those
+        questions are asked again.
+        """
+        known = {
+            name: answers[name] for name in _CONFIG_FIELDS
+            if name in answers and answer_error(name, answers[name]) is None
+        }
+        self.config = TmuxConfig(**known)
+        self.answered = frozenset(known)
+    
+    def _ask_question(self, question: Question):
+        """Ask a single question and update config"""
+        ask = self._dispatch.get(question.type)
+        if ask is not None:
+            setattr(self.config, question.key, ask(question))
+    
+    def _dispatch_bool(self, question: Question) -> bool:
+        """Ask a "bool" question"""
+        return self._ask_yes_no(question.question, question.default, question.help)
+    
+    def _dispatch_choice(self, question: Question) -> Any:
+        """Ask a "choice" question"""
+        return self._ask_choice(question.question, question.choices, question.default, question.help)
+    
+    def _dispatch_choice_colored(self, question: Question) -> Any:
+        """Ask a "choice_colored" question"""
+        return self._ask_choice_colored(question.question, question.choices, question.default, question.help)
+    
+    def _dispatch_multiselect(self, question: Question) -> List[str]:
+        """Ask a "multiselect" question"""
+        return self._ask_multiselect(question.question, question.choices, question.help)
+    
+    def _dispatch_number(self, question: Question) -> int:
+        """Ask a "number" question"""
+        return self._ask_number(question.question, question.default, question.min, question.max, question.help)
+    
+    def _dispatch_text(self, question: Question) -> str:
+        """Ask a "text" question"""
+        return self._ask_text(question.question, question.default, question.help)
     
     def _ask_yes_no(self, question: str, default: bool = False, help_key: str = None) -> bool:
         """Ask a yes/no question"""
-        default_str = "Y/n" if default else "y/N"
+        default_str = _YN_STR[bool(default)]
+        # Only offer help when there is some to show
+        if help_key:
+            message, invalid = f"{question} [{default_str}] (? for help): ", _INVALID_YES_NO
+        else:
+            message, invalid = f"{question} [{default_str}]: ", _INVALID_YES_NO_NO_HELP
         while True:
-            response = input(f"{question} [{default_str}] (? for help): ").strip().lower()
+            response = _prompt(message).strip().lower()
             if response == '?' and help_key:
                 self._show_help(help_key)
                 continue
             if not response:
                 return default
-            if response in ['y', 'yes']:
+            if response in _YES:
                 return True
-            if response in ['n', 'no']:
+            if response in _NO:
                 return False
-            print("Please enter 'y' or 'n' (or '?' for help)")
+            sys.stdout.write(invalid)
     
     def _ask_choice(self, question: str, choices: List[tuple], default: Any = None, help_key: str = None) -> Any:
         """Ask a multiple choice question"""
-        print(f"\n{question}")
+        lines = [f"\n{question}\n"]
         for i, (value, description) in enumerate(choices, 1):
             marker = " (default)" if value == default else ""
-            print(f"  {i}. {description}{marker}")
+            lines.append(f"  {i}. {description}{marker}\n")
+        sys.stdout.write("".join(lines))
         
         while True:
-            try:
-                response = input(f"Choose option [1-{len(choices)}] (? for help): ").strip()
-                if response == '?' and help_key:
-                    self._show_help(help_key)
-                    continue
-                if not response and default is not None:
-                    return default
-                
-                choice_num = int(response) - 1
-                if 0 <= choice_num < len(choices):
-                    return choices[choice_num][0]
-                else:
-                    print(f"Please enter a number between 1 and {len(choices)}")
-            except ValueError:
-                print("Please enter a valid number (or '?' for help)")
+            response = _prompt(f"Choose option [1-{len(choices)}] (? for help): ").strip()
+            if response == '?' and help_key:
+                self._show_help(help_key)
+                continue
+            if not response and default is not None:
+                return default
+            if not response.isdecimal():
+                sys.stdout.write(_INVALID_NUMBER)
+                continue
+            
+            choice_num = int(response) - 1
+            if 0 <= choice_num < len(choices):
+                return choices[choice_num][0]
+            else:
+                print(f"Please enter a number between 1 and {len(choices)}")
     
     def _ask_choice_colored(self, question: str, choices: List[tuple], default: Any = None, help_key: str = None) -> Any:
         """Ask a multiple choice question with colored options for color schemes"""
-        print(f"\n{question}")
-        reset = "\033[0m"
-        
+        lines = [f"\n{question}\n"]
         for i, (value, description) in enumerate(choices, 1):
             marker = " (default)" if value == default else ""
-            if value in self.color_schemes:
-                colors = self.color_schemes[value]
-                colored_text = f"{colors['bg']}{colors['fg']} {description} {reset}"
-                print(f"  {i}. {colored_text}{marker}")
+            prefix = _SCHEME_PREFIXES.get(value)
+            if prefix is not None:
+                lines.append(f"  {i}. {prefix} {description} {_RESET}{marker}\n")
             else:
-                print(f"  {i}. {description}{marker}")
+                lines.append(f"  {i}. {description}{marker}\n")
+        sys.stdout.write("".join(lines))
         
         while True:
-            try:
-                response = input(f"Choose option [1-{len(choices)}] (? for help): ").strip()
-                if response == '?' and help_key:
-                    self._show_help(help_key)
-                    continue
-                if not response and default is not None:
-                    return default
-                
-                choice_num = int(response) - 1
-                if 0 <= choice_num < len(choices):
-                    return choices[choice_num][0]
-                else:
-                    print(f"Please enter a number between 1 and {len(choices)}")
-            except ValueError:
-                print("Please enter a valid number (or '?' for help)")
+            response = _prompt(f"Choose option [1-{len(choices)}] (? for help): ").strip()
+            if response == '?' and help_key:
+                self._show_help(help_key)
+                continue
+            if not response and default is not None:
+                return default
+            if not response.isdecimal():
+                sys.stdout.write(_INVALID_NUMBER)
+                continue
+            
+            choice_num = int(response) - 1
+            if 0 <= choice_num < len(choices):
+                return choices[choice_num][0]
+            else:
+                print(f"Please enter a number between 1 and {len(choices)}")
     
     def _ask_multiselect(self, question: str, choices: List[tuple], help_key: str = None) -> List[str]:
         """Ask a multiple selection question"""
-        print(f"\n{question}")
-        print("(Enter comma-separated numbers, or press Enter for none)")
+        lines = [f"\n{question}\n(Enter comma-separated numbers, or press Enter for none)\n"]
         for i, (value, description) in enumerate(choices, 1):
-            print(f"  {i}. {description}")
+            lines.append(f"  {i}. {description}\n")
+        sys.stdout.write("".join(lines))
         
         while True:
-            response = input("Choose options (? for help): ").strip()
+            response = _prompt("Choose options (? for help): ").strip()
             if response == '?' and help_key:
                 self._show_help(help_key)
                 continue
@@ -519,67 +690,98 @@ class TmuxQuestionnaire:
                 return []
             
             try:
-                selected_nums = [int(x.strip()) for x in response.split(',') if x.strip()]
-                selected_values = []
+                if _SELECTION_RE.fullmatch(response) is None:
+                    raise ValueError(f"Invalid selection: {response}")
+                selected_nums = [int(num) for num in _NUMBER_RE.findall(response)]
                 
                 for num in selected_nums:
-                    if 1 <= num <= len(choices):
-                        selected_values.append(choices[num-1][0])
-                    else:
+                    if not 1 <= num <= len(choices):
                         raise ValueError(f"Invalid choice: {num}")
                 
-                return selected_values
+                return [choices[num - 1][0] for num in selected_nums]
             except ValueError as e:
                 print(f"Error: {e}. Please enter valid numbers separated by commas (or '?' for help).")
     
     def _ask_number(self, question: str, default: int, min_val: int, max_val: int, help_key: str = None) -> int:
         """Ask for a numeric input"""
         while True:
-            try:
-                response = input(f"{question} [{default}] (? for help): ").strip()
-                if response == '?' and help_key:
-                    self._show_help(help_key)
-                    continue
-                if not response:
-                    return default
-                
-                value = int(response)
-                if min_val <= value <= max_val:
-                    return value
-                else:
-                    print(f"Please enter a number between {min_val} and {max_val}")
-            except ValueError:
-                print("Please enter a valid number (or '?' for help)")
+            response = _prompt(f"{question} [{default}] (? for help): ").strip()
+            if response == '?' and help_key:
+                self._show_help(help_key)
+                continue
+            if not response:
+                return default
+            if not response.isdecimal():
+                sys.stdout.write(_INVALID_NUMBER)
+                continue
+            
+            value = int(response)
+            if min_val <= value <= max_val:
+                return value
+            else:
+                print(f"Please enter a number between {min_val} and {max_val}")
     
     def _ask_text(self, question: str, default: str = "", help_key: str = None) -> str:
         """Ask for text input"""
         while True:
-            response = input(f"{question} [{default}] (? for help): ").strip()
+            response = _prompt(f"{question} [{default}] (? for help): ").strip()
             if response == '?' and help_key:
                 self._show_help(help_key)
                 continue
             return response if response else default
 
 
-def main():
-    """Main function to run the questionnaire"""
+def load_saved_answers() -> Optional[Dict[str, Any]]:
+    """Return the answers saved by a previous run, if they are newer than this module"""
+    try:
+        if os.path.getmtime(_CONFIG_PATH) <= os.path.getmtime(__file__):
+            return None
+        with open(_CONFIG_PATH, 'rb') as f:
+            answers = _load_json(f.read())
+    except (OSError, ValueError):
+        return None
+    return answers if isinstance(answers, dict) else None
+
+
+def main(unattended: Optional[bool] = None):
+    """Main function to run the questionnaire
+    
+    In unattended mode (the default when stdin is not a terminal) the answers
+    are read as one JSON object from stdin instead of being asked for.
+    """
+    if unattended is None:
+        unattended = not sys.stdin.isatty()
+    
     questionnaire = TmuxQuestionnaire()
-    config = questionnaire.run_questionnaire()
     
-    print("\n" + "=" * 60)
-    print("🎉 Configuration complete!")
-    print("=" * 60)
+    if unattended:
+        try:
+            answers = _load_json(sys.stdin.read())
+        except ValueError:
+            answers = None
+        if not isinstance(answers, dict):
+            sys.exit("❌ Unattended mode expects a JSON object of answers on stdin")
+        for key, value in answers.items():
+            error = answer_error(key, value) if key in _FIELD_TYPES else None
+            if error:
+                sys.exit(f"❌ Invalid value for \"{key}\": {error}")
+        questionnaire.reuse_answers(answers)
+        config = questionnaire.config
+    else:
+        saved = load_saved_answers()
+        if saved and questionnaire._ask_yes_no(
+                "📂 Found answers from a previous run. Reuse them and only ask new questions?", True):
+            questionnaire.reuse_answers(saved)
+        
+        config = questionnaire.run_questionnaire()
+    
+    sys.stdout.write(_COMPLETE)
     
     # Save configuration to JSON for the generator
-    config_path = os.path.join(os.path.dirname(__file__), 'tmux_config.json')
-    with open(config_path, 'w') as f:
-        json.dump(asdict(config), f, indent=2)
-    
-    print(f"Configuration saved to: {config_path}")
-    print("\nNext steps:")
-    print("1. Run the tmux config generator to create your .tmux.conf file")
-    print("2. Copy the generated config to ~/.tmux.conf")
-    print("3. Reload tmux or start a new session to apply changes")
+    with open(_CONFIG_PATH, 'wb') as f:
+        f.write(_dump_json(config.to_dict()))
+    
+    sys.stdout.write(f"Configuration saved to: {_CONFIG_PATH}\n{_NEXT_STEPS}")
     
     return config
 
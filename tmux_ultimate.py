@@ -6,14 +6,30 @@ Main launcher script for the complete tmux configuration system
 
 import sys
 import os
-import subprocess
-import argparse
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Tuple
 
+if TYPE_CHECKING:
+    import argparse
 
-def print_banner():
-    """Print the application banner"""
-    banner = """
+
+# Default location of the user's tmux configuration
+DEFAULT_CONFIG_PATH = os.path.expanduser("~/.tmux.conf")
+
+# Questionnaire answers and generated config kept beside this script
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_CONFIG_JSON = os.path.join(_HERE, 'tmux_config.json')
+_DEFAULT_CONF = os.path.join(_HERE, 'tmux.conf')
+
+# Menu choices that pause for Enter before the menu is shown again
+_PAUSE_CHOICES = frozenset(("1", "2", "3", "4", "5", "6", "7"))
+
+# Parsed questionnaire responses by path, with the file's mtime and size
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+
+# Fixed text shown by the launcher
+_BANNER = """
 ╔═══════════════════════════════════════════════════════════════════╗
 ║                                                                   ║
 ║  ████████╗███╗   ███╗██╗   ██╗██╗  ██╗    ██╗   ██╗██╗  ████████╗ ║
@@ -27,8 +43,100 @@ def print_banner():
 ║                   For Linux Power Users                          ║
 ║                                                                   ║
 ╚═══════════════════════════════════════════════════════════════════╝
+
+"""
+
+_MENU = (
+    "\n🎯 What would you like to do?\n"
+    f"{'=' * 50}\n"
+    "1. 📝 Run Configuration Questionnaire\n"
+    "2. ⚙️  Generate TMUX Configuration\n"
+    "3. 🔄 Complete Setup (Questionnaire + Generation)\n"
+    "4. 📖 View Current Configuration\n"
+    "5. 🔌 Install TPM & Plugins\n"
+    "6. 🧹 Clean Generated Files\n"
+    "7. ℹ️  Show Help & Instructions\n"
+    "8. 🚪 Exit\n"
+    f"{'=' * 50}\n"
+)
+
+_HELP_TEXT = """
+🔧 TMUX Ultimate Configuration Generator Help
+═══════════════════════════════════════════════════════════════════
+
+📋 OVERVIEW:
+This tool helps you create the perfect tmux configuration for your 
+Linux power user setup through an interactive questionnaire.
+
+🚀 GETTING STARTED:
+1. Run the questionnaire to define your preferences
+2. Generate your custom tmux configuration
+3. Install and apply the configuration
+
+📝 CONFIGURATION AREAS:
+• Core Settings (prefix key, mouse support)
+• Appearance & Status Bar (colors, themes, layout)
+• Behavior & Performance (history, indexing, naming)
+• Terminal Integration (color support, key modes)
+• Vim Integration (navigation, copy mode)
+• Plugin Management (TPM, popular plugins)
+• Advanced Features (clipboard, logging, synchronization)
+
+⚙️ INSTALLATION STEPS:
+1. Generate your configuration using this tool
+2. Copy generated file: cp tmux.conf ~/.tmux.conf
+3. If using plugins, install TPM first:
+   git clone https://github.com/tmux-plugins/tpm ~/.tmux/plugins/tpm
+4. Reload tmux: tmux source-file ~/.tmux.conf
+5. Install plugins (if any): Prefix + I
+
+🔧 CUSTOMIZATION:
+• All settings are configurable through the questionnaire
+• Advanced users can edit the generated config file directly
+• Multiple color schemes supported (Dracula, Nord, Gruvbox, etc.)
+• Vim integration for seamless workflow
+
+📚 USEFUL TMUX COMMANDS:
+• Prefix + r : Reload configuration
+• Prefix + | : Split window horizontally  
+• Prefix + - : Split window vertically
+• Prefix + h/j/k/l : Navigate panes (if Vim mode enabled)
+• Alt + arrows : Navigate panes without prefix
+
+🆘 TROUBLESHOOTING:
+• Make sure tmux is installed: sudo apt install tmux (or equivalent)
+• Check tmux version: tmux -V (2.6+ recommended)
+• Verify Python 3.6+: python3 --version
+• For plugin issues, ensure TPM is properly installed
+
+📖 MORE RESOURCES:
+• TMUX Manual: man tmux
+• TMUX Wiki: https://github.com/tmux/tmux/wiki
+• Popular configurations: Search "tmux.conf" on GitHub
+
+═══════════════════════════════════════════════════════════════════
+
 """
-    print(banner)
+
+
+def load_config_cached(path: str) -> dict:
+    """Load questionnaire responses, reusing the parsed data while the file is unchanged"""
+    from tmux_generator import load_config
+    
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    config_data = load_config(path)
+    _CONFIG_CACHE[path] = (stamp, config_data)
+    return config_data
+
+
+def print_banner():
+    """Print the application banner"""
+    sys.stdout.write(_BANNER)
 
 
 def check_python_version():
@@ -41,28 +149,18 @@ def check_python_version():
 
 def check_dependencies():
     """Check if required dependencies are available"""
-    try:
-        import json
-        import dataclasses
-        return True
-    except ImportError as e:
-        print(f"❌ Error: Missing required dependency: {e}")
-        return False
+    from importlib.util import find_spec
+    
+    for name in ("json", "dataclasses"):
+        if find_spec(name) is None:
+            print(f"❌ Error: Missing required dependency: No module named '{name}'")
+            return False
+    return True
 
 
 def show_menu():
     """Show the main menu"""
-    print("\n🎯 What would you like to do?")
-    print("=" * 50)
-    print("1. 📝 Run Configuration Questionnaire")
-    print("2. ⚙️  Generate TMUX Configuration")
-    print("3. 🔄 Complete Setup (Questionnaire + Generation)")
-    print("4. 📖 View Current Configuration")
-    print("5. 🔌 Install TPM & Plugins")
-    print("6. 🧹 Clean Generated Files")
-    print("7. ℹ️  Show Help & Instructions")
-    print("8. 🚪 Exit")
-    print("=" * 50)
+    sys.stdout.write(_MENU)
 
 
 def run_questionnaire():
@@ -70,7 +168,7 @@ def run_questionnaire():
     print("\n🚀 Starting Configuration Questionnaire...")
     try:
         from tmux_questionnaire import main as questionnaire_main
-        return questionnaire_main()
+        return questionnaire_main(unattended=False)
     except ImportError:
         print("❌ Error: questionnaire module not found")
         return None
@@ -84,25 +182,23 @@ def generate_config(output_path: str = None):
     print("\n⚙️ Generating TMUX Configuration...")
     try:
         from tmux_generator import TmuxConfigGenerator
-        import json
         
-        config_json_path = os.path.join(os.path.dirname(__file__), 'tmux_config.json')
+        config_json_path = _CONFIG_JSON
         if not os.path.exists(config_json_path):
             print("❌ Configuration file not found!")
             print("   Please run the questionnaire first.")
             return False
         
         # Load configuration
-        with open(config_json_path, 'r') as f:
-            config_data = json.load(f)
+        config_data = load_config_cached(config_json_path)
         
-        # Generate configuration
+        # Generate configuration, fully rendered before anything is written
         generator = TmuxConfigGenerator(config_data)
-        tmux_config = generator.generate_config()
+        chunks = tuple(generator.iter_config())
         
         # Determine output path
         if output_path is None:
-            output_path = os.path.join(os.path.dirname(__file__), 'tmux.conf')
+            output_path = _DEFAULT_CONF
         
         # Final safety check
         if os.path.exists(output_path):
@@ -110,8 +206,8 @@ def generate_config(output_path: str = None):
             return False
         
         # Save configuration
-        with open(output_path, 'w') as f:
-            f.write(tmux_config)
+        with open(output_path, 'w', buffering=1 << 16) as f:
+            f.writelines(chunks)
         
         print("🎉 TMUX configuration generated successfully!")
         print(f"📄 Configuration saved to: {output_path}")
@@ -137,16 +233,33 @@ def view_configuration(output_path: str = "tmux.conf"):
     print("\n📖 Current TMUX Configuration:")
     print("=" * 60)
     try:
-        with open(config_file, 'r') as f:
-            content = f.read()
-            # Show first 50 lines to avoid overwhelming output
-            lines = content.split('\n')
-            for i, line in enumerate(lines[:50], 1):
-                print(f"{i:3d}: {line}")
-            
-            if len(lines) > 50:
-                print(f"... and {len(lines) - 50} more lines")
-                print(f"\nTotal lines: {len(lines)}")
+        # Show first 50 lines to avoid overwhelming output, and count the
+        # rest in fixed-size chunks rather than reading the whole file
+        with open(config_file, 'rb') as f:
+            preview = []
+            for _ in range(50):
+                line = f.readline()
+                if not line:
+                    break
+                preview.append(line)
+            newlines = sum(line.endswith(b'\n') for line in preview)
+            newlines += sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 16), b''))
+        
+        # Like str.split('\n'), a trailing newline ends with an empty line
+        total = newlines + 1
+        if len(preview) < min(total, 50):
+            preview.append(b'')
+        
+        for i, line in enumerate(preview, 1):
+            if line.endswith(b'\n'):
+                line = line[:-1]
+            if line.endswith(b'\r'):
+                line = line[:-1]
+            print(f"{i:3d}: {line.decode('utf-8', 'replace')}")
+        
+        if total > 50:
+            print(f"... and {total - 50} more lines")
+            print(f"\nTotal lines: {total}")
         
         print("=" * 60)
         print(f"📄 Full file available at: {config_file.absolute()}")
@@ -157,17 +270,17 @@ def view_configuration(output_path: str = "tmux.conf"):
 
 def install_tpm_and_plugins():
     """Install TPM and configured plugins"""
+    import subprocess
+    
     print("\n🔌 Installing TPM and Plugins...")
     
     # Check if config exists to see what plugins are enabled
-    config_json_path = os.path.join(os.path.dirname(__file__), 'tmux_config.json')
+    config_json_path = _CONFIG_JSON
     plugins = []
     
     if os.path.exists(config_json_path):
         try:
-            import json
-            with open(config_json_path, 'r') as f:
-                config_data = json.load(f)
+            config_data = load_config_cached(config_json_path)
             plugins = config_data.get('plugins', [])
             use_tpm = config_data.get('use_tpm', False)
             
@@ -232,12 +345,13 @@ def clean_files():
     
     cleaned = []
     for file in files_to_clean:
-        if Path(file).exists():
-            try:
-                Path(file).unlink()
-                cleaned.append(file)
-            except Exception as e:
-                print(f"❌ Error deleting {file}: {e}")
+        try:
+            os.unlink(file)
+            cleaned.append(file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"❌ Error deleting {file}: {e}")
     
     if cleaned:
         print(f"🧹 Cleaned files: {', '.join(cleaned)}")
@@ -247,67 +361,14 @@ def clean_files():
 
 def show_help():
     """Show help and instructions"""
-    help_text = """
-🔧 TMUX Ultimate Configuration Generator Help
-═══════════════════════════════════════════════════════════════════
+    sys.stdout.write(_HELP_TEXT)
 
-📋 OVERVIEW:
-This tool helps you create the perfect tmux configuration for your 
-Linux power user setup through an interactive questionnaire.
 
-🚀 GETTING STARTED:
-1. Run the questionnaire to define your preferences
-2. Generate your custom tmux configuration
-3. Install and apply the configuration
-
-📝 CONFIGURATION AREAS:
-• Core Settings (prefix key, mouse support)
-• Appearance & Status Bar (colors, themes, layout)
-• Behavior & Performance (history, indexing, naming)
-• Terminal Integration (color support, key modes)
-• Vim Integration (navigation, copy mode)
-• Plugin Management (TPM, popular plugins)
-• Advanced Features (clipboard, logging, synchronization)
-
-⚙️ INSTALLATION STEPS:
-1. Generate your configuration using this tool
-2. Copy generated file: cp tmux.conf ~/.tmux.conf
-3. If using plugins, install TPM first:
-   git clone https://github.com/tmux-plugins/tpm ~/.tmux/plugins/tpm
-4. Reload tmux: tmux source-file ~/.tmux.conf
-5. Install plugins (if any): Prefix + I
-
-🔧 CUSTOMIZATION:
-• All settings are configurable through the questionnaire
-• Advanced users can edit the generated config file directly
-• Multiple color schemes supported (Dracula, Nord, Gruvbox, etc.)
-• Vim integration for seamless workflow
-
-📚 USEFUL TMUX COMMANDS:
-• Prefix + r : Reload configuration
-• Prefix + | : Split window horizontally  
-• Prefix + - : Split window vertically
-• Prefix + h/j/k/l : Navigate panes (if Vim mode enabled)
-• Alt + arrows : Navigate panes without prefix
-
-🆘 TROUBLESHOOTING:
-• Make sure tmux is installed: sudo apt install tmux (or equivalent)
-• Check tmux version: tmux -V (2.6+ recommended)
-• Verify Python 3.6+: python3 --version
-• For plugin issues, ensure TPM is properly installed
-
-📖 MORE RESOURCES:
-• TMUX Manual: man tmux
-• TMUX Wiki: https://github.com/tmux/tmux/wiki
-• Popular configurations: Search "tmux.conf" on GitHub
-
-═══════════════════════════════════════════════════════════════════
-"""
-    print(help_text)
-
-
-def parse_arguments():
-    """Parse command line arguments"""
+@lru_cache(maxsize=None)
+def _get_parser() -> "argparse.ArgumentParser":
+    """Build the command line parser once and reuse it"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="TMUX Ultimate Configuration Generator",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -324,11 +385,16 @@ If the target file exists, the tool will warn you and exit safely.
     
     parser.add_argument(
         "-o", "--output",
-        default=os.path.expanduser("~/.tmux.conf"),
+        default=DEFAULT_CONFIG_PATH,
         help="Output file path (default: ~/.tmux.conf)"
     )
     
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments():
+    """Parse command line arguments"""
+    return _get_parser().parse_args()
 
 
 def check_output_file_safety(output_path: str) -> bool:
@@ -420,7 +486,7 @@ def main():
             print(f"\n❌ An error occurred: {e}")
         
         # Pause before showing menu again
-        if choice in ['1', '2', '3', '4', '5', '6', '7']:
+        if choice in _PAUSE_CHOICES:
             input("\n📎 Press Enter to continue...")
 
 